@@ -1,29 +1,55 @@
-from pathlib import Path
+import importlib
 
-try:
-    version_path = Path(__file__).parent / "VERSION"
-    version = version_path.read_text().strip()
-    del version_path
-except FileNotFoundError:
-    version = "0.0.0"
+# Submodules and top-level API members are resolved lazily on first access
+# (PEP 562), so `import pewpew` does not pay for importing everything up
+# front. Values are "module" or "module:attribute".
+_LAZY = {
+    # submods
+    "api": "pewpew.api",
+    "beam": "pewpew.beam",
+    "tracing": "pewpew.tracing",
+    "utils": "pewpew.utils",
+    # top level everything
+    "Beam": "pewpew.beam:Beam",
+    "trace": "pewpew.tracing:trace",
+    "jit_trace": "pewpew.tracing:jit_trace",
+    "clear_trace_history": "pewpew._context:clear_trace_history",
+    "draw_trace": "pewpew._plotting:draw_trace",
+}
 
-__version__ = version
-del version
-del Path
+__all__ = list(_LAZY)
 
-# submods to include in *
-from . import api
-from . import beam
-from . import tracing
-from . import utils
 
-# top level everything
-from .api import *
+def _read_version():
+    from pathlib import Path
 
-__all__ = [
-    # submods
-    "api",
-    "beam",
-    "trace",
-    "utils",
-]
+    try:
+        return (Path(__file__).parent / "VERSION").read_text().strip()
+    except FileNotFoundError:
+        return "0.0.0"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # only read the VERSION file for whoever actually asks for it
+        globals()[name] = version = _read_version()
+        return version
+
+    try:
+        spec = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    mod_name, _, attr = spec.partition(":")
+    mod = importlib.import_module(mod_name)
+    value = getattr(mod, attr) if attr else mod
+
+    # cache so subsequent lookups never hit `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {"__version__"})
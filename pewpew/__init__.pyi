@@ -0,0 +1,15 @@
+# Type stub mirroring the lazily-resolved attributes in `__init__.py`, so
+# IDEs and type checkers see the same names the old eager imports exposed.
+
+from . import api as api
+from . import beam as beam
+from . import tracing as tracing
+from . import utils as utils
+from .beam import Beam as Beam
+from .tracing import jit_trace as jit_trace
+from .tracing import trace as trace
+from ._context import clear_trace_history as clear_trace_history
+from ._plotting import draw_trace as draw_trace
+
+__version__: str
+__all__: list
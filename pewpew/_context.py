@@ -5,12 +5,10 @@ The global context. Collects all `Beam` traces while active
 """
 
 import collections
-import copy
 import os
 import threading
 
 from pewpew._logging import get_logger
-from pewpew.utils import iterables as iter_utils
 
 __all__ = [
     "clear_trace_history",
@@ -19,9 +17,11 @@ __all__ = [
 logger = get_logger(__name__)
 
 # Used to serialize access to shared context data structures in `pewpew`.
-# TODO: @TayTay -- consider whether should be a `Lock` instead
-_lock = threading.RLock()
-_int_safe = lambda _x: int(_x) if _x is not None else None
+# None of the critical sections re-enter the lock, so a plain `Lock` is
+# sufficient (and cheaper to acquire than an `RLock`).
+_lock = threading.Lock()
+# an unset *or empty* `PEWPEW_TRACE_HISTORY_SIZE` means an unbounded history
+_int_safe = lambda _x: int(_x) if _x else None
 _get_hist_len = lambda: _int_safe(os.environ.get("PEWPEW_TRACE_HISTORY_SIZE", None))
 
 
@@ -71,13 +71,24 @@ class _ContextStore:
     ----------
     _root : TraceContext
     _head : TraceContext
-    _trace_history : list
+    _active : bool
+    _trace_history : collections.deque
+    _by_name : dict
+        Maps a trace name to a deque of the traces in `_trace_history`
+        with that name, oldest first.
     """
 
+    __slots__ = (
+        "_root",
+        "_head",
+        "_active",
+        "_trace_history",
+        "_maxlen",
+        "_by_name",
+    )
+
     def __init__(self, history_size=None):
-        logger.debug(
-            f"Creating new context store for thread: {threading.currentThread().ident}"
-        )
+        logger.debug(f"Creating new context store for thread: {threading.get_ident()}")
         self._reset(history_size)
         self._maxlen = history_size
 
@@ -86,7 +97,9 @@ class _ContextStore:
         with _lock:
             self._root = None  # handle to parent trace history node
             self._head = None  # handle to the tip of the nodes
+            self._active = False  # lock-free hint that `_head` is not None
             self._trace_history = collections.deque(maxlen=history_size)
+            self._by_name = {}  # name -> deque of traces, oldest first
 
     def push(self, trace_context):
         """(Potentially create) and mark a child context active
@@ -95,17 +108,18 @@ class _ContextStore:
         decorator internally creates and uses a `TraceContext`, but they
         can also be manually created.
         """
+        logger.debug(f"Pushing new `TraceContext` for thread: {threading.get_ident()}")
         with _lock:
-            logger.debug(
-                f"Pushing new `TraceContext` for thread: {threading.currentThread().ident}"
-            )
+            head = self._head
+
             # no active context, outer decorator
-            if self._root is None:
+            if head is None:
                 self._root = self._head = trace_context
             else:
                 # add child to existing parent, update head
-                self._head.link_child(trace_context)
+                head.link_child(trace_context)
                 self._head = trace_context
+            self._active = True
 
     def pop(self):
         """Pop the head of the store
@@ -114,34 +128,62 @@ class _ContextStore:
         decorator internally creates and uses a `TraceContext`, but they
         can also be manually created.
         """
+        logger.debug(f"Popping `TraceContext` for thread: {threading.get_ident()}")
         with _lock:
-            logger.debug(
-                f"Popping `TraceContext` for thread: {threading.currentThread().ident}"
-            )
+            head = self._head
+
             # Only happens if external user is messing with this
-            if self._head is None:
+            if head is None:
                 return
 
-            head = self._head
-
             # NOTE: we do NOT clear the handle to the child so the beam
             # history is retained after the decorator is exited. If we
             # cleared the `_child` pointer, we'd not be able to recover
             # the traces. We only push back the pointer to `_head`
-            self._head = head._parent
+            parent = self._head = head._parent
+            self._active = parent is not None
 
-            # Base case: if head is now None, `head` was the root. We
+            # Base case: if parent is None, `head` was the root. We
             # want to retain the history of the code path / traces, so
             # we push the parent into the history.
-            if self._head is None:
+            if parent is None:
                 self._root = None
-                self._trace_history.append(head)
+                self._archive(head)
+
+    def _archive(self, trace):
+        """Append a root trace to the history, keeping `_by_name` in sync
+
+        Must be called while holding `_lock`.
+        """
+        history = self._trace_history
+        if history.maxlen == 0:
+            return
+
+        # a bounded deque silently drops its oldest element when full, so
+        # drop that trace from the name index as well
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            same_name = self._by_name[evicted._name]
+            same_name.popleft()
+            if not same_name:
+                del self._by_name[evicted._name]
+
+        history.append(trace)
+        self._by_name.setdefault(trace._name, collections.deque()).append(trace)
 
     def track_beam(self, beam):
         """If an active context is present, track a new beam"""
+        # Fast path for beams created outside of any trace: skip the lock
+        # entirely. Reading a bool attribute is atomic under the GIL, and
+        # racing a concurrent `push` is equivalent to the beam having been
+        # created a moment earlier.
+        if not self._active:
+            return
+
         with _lock:
-            if self._head is not None:
-                self._head._track_beam(beam)
+            head = self._head
+            if head is not None:
+                head._track_beam(beam)
 
     def get_trace(self, name=None, idx=None):
         """Find a trace by name or index
@@ -153,25 +195,26 @@ class _ContextStore:
         if name is None and idx is None:
             idx = -1
 
-        beams = []
+        # only snapshot the root of the trace under the lock. Traces in the
+        # history are already exited, so walking the chain below does not
+        # need to block `push`/`pop`/`track_beam`
+        trace = None
         with _lock:
             if self._trace_history:
                 if idx is not None:
                     trace = self._trace_history[idx]
                 else:
-                    trace = iter_utils.find_first(
-                        self._trace_history[::-1],  # reverse order, recent first
-                        lambda t: t.name == name,
-                    )
+                    same_name = self._by_name.get(name)
+                    if same_name:
+                        trace = same_name[-1]  # most recent
 
-                # else flatten the linked list into beams
-                while trace is not None:
-                    beams.extend(trace.beams)
-                    trace = trace._child
-
-                return beams
+        # flatten the linked list into beams
+        beams = []
+        while trace is not None:
+            beams.extend(trace._beams)
+            trace = trace._child
 
-            return beams
+        return beams
 
 
 def clear_trace_history():
@@ -182,10 +225,14 @@ def clear_trace_history():
     preventing any very large trace history from growing the program's memory
     footprint.
     """
+    global ContextStore
+
+    # build the new store outside the lock; `_ContextStore.__init__`
+    # acquires it itself, and `_lock` is not reentrant
+    store = _ContextStore(_get_hist_len())
     with _lock:
-        # drop existing state, create new
-        global ContextStore
-        ContextStore = _ContextStore(_get_hist_len())
+        # drop existing state, swap in new
+        ContextStore = store
 
 
 # Singleton instance
@@ -215,13 +262,16 @@ class TraceContext:
         drawn.
     """
 
+    __slots__ = ("_name", "_parent", "_child", "_beams")
+
     def __init__(self, name):
         self._name = name
         self._parent = None
         self._child = None
 
-        # all tracked beams while this context is the active one
-        self._beams = []
+        # all tracked beams while this context is the active one. Only ever
+        # appended to and iterated front to back
+        self._beams = collections.deque()
 
     def __enter__(self):
         """Enter the trace context
@@ -248,21 +298,18 @@ class TraceContext:
 
     def _track_beam(self, beam):
         """Track a beam assigned in this context"""
-        logger.debug(f"Tracking `Beam` for thread: {threading.currentThread().ident}")
+        logger.debug(f"Tracking `Beam` for thread: {threading.get_ident()}")
         self._beams.append(beam)
 
     @property
     def beams(self):
-        """Return copies of the context's beams pre-pended with the context name"""
+        """Return a snapshot of the context's beams
 
-        # TODO: consider greater fine grain control over this
-        # def _copy_beam(beam):
-        #     beam = copy.deepcopy(beam)
-        #     beam.name = f"{self.name}.{beam.name}"
-        #     return beam
-        # return [_copy_beam(b) for b in self._beams]
-
-        return copy.deepcopy(self._beams)
+        This is a shallow copy: the returned list can be modified without
+        affecting the context, but the `Beam` objects are shared, so their
+        timing buffers are never duplicated.
+        """
+        return list(self._beams)
 
     @property
     def name(self):
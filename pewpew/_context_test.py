@@ -73,3 +73,33 @@ class TestContextStoreDirect(unittest.TestCase):
         # flattening all beams in last trace history should be 3
         beams = ctx.ContextStore.get_trace()
         assert len(beams) == 3
+
+    def test_get_trace_by_name(self):
+        ctx.clear_trace_history()
+
+        for name in ("first", "second", "first"):
+            with ctx.TraceContext(name=name):
+                pewpew.Beam(f"{name}_beam")
+
+        # the most recent trace with a matching name wins
+        beams = ctx.ContextStore.get_trace(name="first")
+        assert len(beams) == 1
+        assert beams[0] is ctx.ContextStore._trace_history[-1]._beams[0]
+
+        assert len(ctx.ContextStore.get_trace(name="second")) == 1
+        assert ctx.ContextStore.get_trace(name="missing") == []
+
+    def test_name_index_follows_evictions(self):
+        ctx.clear_trace_history()
+        store = ctx._ContextStore(history_size=2)
+
+        for name in ("a", "b", "a", "c"):
+            trace = ctx.TraceContext(name=name)
+            store.push(trace)
+            store.pop()
+
+        # "b" and the first "a" were evicted from the bounded history
+        assert [t.name for t in store._trace_history] == ["a", "c"]
+        assert set(store._by_name) == {"a", "c"}
+        assert len(store._by_name["a"]) == 1
+        assert store.get_trace(name="b") == []
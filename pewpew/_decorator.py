@@ -4,7 +4,8 @@
 Useful decorators and utils
 """
 
-import inspect
+import functools
+import sys
 
 from pewpew import _context as ctx
 
@@ -12,34 +13,38 @@ __all__ = [
     "make_decorator",
 ]
 
-
-class Decorator:
-    """Decorated wrapper to carry over metadata from the decorated fn"""
-
-    def __init__(self, func, name):
-        self._fn = func
-        self._name = name
-
-        if hasattr(func, "__name__"):
-            self.__name__ = func.__name__
-        if hasattr(func, "__qualname__"):
-            self.__qualname__ = func.__qualname__
-
-    def __call__(self, *args, **kwargs):
-        """This is the primary entrypoint to the decorated function"""
-        # TODO: use a UUID4 rather than name here?
-        with ctx.TraceContext(self.name):
-            return self._fn(*args, **kwargs)
-
-    @property
-    def name(self):
-        return self._name
+# bound once; resolved on every traced call otherwise
+_TraceContext = ctx.TraceContext
 
 
 def make_decorator(func, name=None):
-    """Public wrapper to create a `Decorator` for decorated functions"""
+    """Public wrapper to create a traced wrapper for decorated functions
+
+    The wrapper is a plain closure rather than a callable class instance:
+    calling it costs a single Python frame, and, being a function, it binds
+    like one when it decorates a method. `functools.wraps` carries over
+    `__name__`, `__qualname__`, `__doc__`, `__module__`, etc., merges in
+    the function's `__dict__` and sets `__wrapped__`, so
+    `inspect.signature`/`inspect.unwrap` and profilers see through it. The
+    trace name is exposed as the wrapper's `name` attribute.
+    """
     if name is None:
-        name = inspect.currentframe().f_back.f_code.co_name
+        try:
+            name = sys._getframe(1).f_code.co_name
+        except (AttributeError, ValueError):
+            # `sys._getframe` is a CPython implementation detail and may be
+            # missing (or have no caller frame) on other interpreters
+            name = getattr(func, "__name__", "function")
+
+    # compiled dispatchers (e.g., numba's, from `jit_trace`) keep the original
+    # function as `py_func`. Take the metadata from that rather than copying
+    # the dispatcher's internal state into the wrapper's `__dict__`
+    @functools.wraps(getattr(func, "py_func", func))
+    def wrapper(*args, **kwargs):
+        # TODO: use a UUID4 rather than name here?
+        with _TraceContext(name):
+            return func(*args, **kwargs)
 
     # TODO: get cute with any other attr automation
-    return Decorator(func, name=name)
+    wrapper.name = name
+    return wrapper
@@ -11,25 +11,33 @@ __all__ = [
     "get_logger",
 ]
 
+# `logging.basicConfig` is a no-op once the root logger has handlers, so
+# only build the handler/formatter and configure logging the first time
+_configured = False
+
 
 def get_logger(name, level=None):
     """Get a PewPew logger"""
+    global _configured
+
     if level is None:
         level = os.environ.get("PEWPEW_LOG_LEVEL", "INFO")
 
     if not isinstance(level, str):
         raise TypeError("Expected a string for `level`")
-    level = logging.getLevelName(level)  # str -> logging level
-
-    log_fmt = "%(asctime)s [%(name)s] [%(levelname)s] %(message)s"
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(logging.Formatter(log_fmt))
-    logging.basicConfig(
-        level=level,
-        format=log_fmt,
-        datefmt="%m-%d %H:%M:%S",
-        handlers=[console_handler],
-    )
+
+    if not _configured:
+        level = logging.getLevelName(level)  # str -> logging level
+        log_fmt = "%(asctime)s [%(name)s] [%(levelname)s] %(message)s"
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
+        console_handler.setFormatter(logging.Formatter(log_fmt))
+        logging.basicConfig(
+            level=level,
+            format=log_fmt,
+            datefmt="%m-%d %H:%M:%S",
+            handlers=[console_handler],
+        )
+        _configured = True
 
     return logging.getLogger(name)
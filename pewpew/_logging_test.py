@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from pewpew import _logging
+
+
+def test_get_logger_validates_level_after_configured():
+    _logging.get_logger("pewpew.test")
+    assert _logging._configured
+
+    # logging is only configured once, but the arg is checked every time
+    with pytest.raises(TypeError):
+        _logging.get_logger("pewpew.test", level=5)
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 
-import sys
-
 from pewpew import _context as ctx
 from pewpew._logging import get_logger
-from pewpew.utils import iterables as iter_utils
 
 logger = get_logger(__name__)
 
+# warn when the clock overhead exceeds this fraction of the shortest span
+_CLOCK_OVERHEAD_WARN_RATIO = 0.1
+
 
 def init_matplotlib(backend=None):
     """Initialize the Matplotlib backend
@@ -19,19 +19,39 @@ def init_matplotlib(backend=None):
     Parameters
     ----------
     backend : str, optional
-        The backend to use by default.
+        The backend to use by default. If None, this is a no-op and
+        matplotlib is not imported.
     """
+    if backend is None:
+        return
+
     import matplotlib
 
     existing_backend = matplotlib.get_backend()
-    if backend is not None:
-        matplotlib.use(backend)
-        logger.debug(
-            f"Currently using '{existing_backend}' matplotlib backend, "
-            f"switching to '{backend}' backend\n"
+    matplotlib.use(backend)
+    logger.debug(
+        f"Currently using '{existing_backend}' matplotlib backend, "
+        f"switching to '{backend}' backend\n"
+    )
+
+
+def _check_clock_resolution(traces):
+    """Warn if the shortest span is too short for the clock to time reliably"""
+    from pewpew.beam import _clock_overhead
+
+    # `timings` builds a new tuple on every read, so read each one once
+    all_timings = (t.timings for t in traces)
+    shortest = min((min(ts) for ts in all_timings if ts), default=None)
+    if shortest is None:
+        return
+
+    overhead = _clock_overhead()
+    if overhead > _CLOCK_OVERHEAD_WARN_RATIO * shortest:
+        logger.warning(
+            f"Shortest span ({shortest:.3g}s) is within "
+            f"{1 / _CLOCK_OVERHEAD_WARN_RATIO:.0f}x of the clock overhead "
+            f"({overhead:.3g}s); its timing is dominated by timer noise"
         )
-    else:
-        logger.debug(f"Using '{existing_backend}' MPL backend\n")
 
 
 def draw_trace(
@@ -148,6 +168,8 @@ def _draw_beams(
     >>> plt_utils.draw_beams(traces, title="example 1", annotate=True)
     >>> plt.show()
     """
+    from pewpew.utils import iterables as iter_utils
+
     iter_utils.assert_sized_iterable(traces, arg_name="traces", gt_size=0)
     iter_utils.assert_sized_iterable(dims, arg_name="dims", eq_size=2)
 
@@ -156,9 +178,13 @@ def _draw_beams(
 
     import matplotlib as mpl
     import matplotlib.pyplot as plt
+    import numpy as np
 
     n_traces = len(traces)
-    cmap = mpl.cm.get_cmap(color_map)
+    # `mpl.cm.get_cmap` is deprecated (and removed in newer matplotlib).
+    # Look up all colors in one vectorized call rather than once per trace
+    cmap = mpl.colormaps[color_map]
+    colors = cmap(np.arange(n_traces) / n_traces)
     fig, axes = plt.subplots(n_traces, sharex=True, gridspec_kw={"hspace": 0}, dpi=dpi)
 
     # if only one trace, make it indexable
@@ -174,15 +200,36 @@ def _draw_beams(
         dims = list(dims[:1]) + [n_traces + 0.5]
     fig.set_size_inches(*dims)
 
+    _check_clock_resolution(traces)
+
+    # Gather each trace's (first start, last stop) in a single pass
+    bounds = np.array([(t._first_start_time(), t._last_end_time()) for t in traces])
+
     # Order traces by when their logical blocks were first entered (min start)
-    traces = sorted(traces, key=lambda s: s._first_start_time())
+    order = np.argsort(bounds[:, 0], kind="stable")
+    traces = [traces[i] for i in order]
 
     # Get min start time to scale all times relative to zero
-    min_start = traces[0]._first_start_time()
-    max_stop = max(t._last_end_time() for t in traces)
+    min_start = bounds[order[0], 0]
+    max_stop = bounds[:, 1].max()
     max_stop_scaled = (max_stop - min_start) + 0.01
     plt.xlim(-0.01, max_stop_scaled)
 
+    # "For each tuple (xmin, xwidth) a rectangle is drawn from xmin to xmin + xwidth"...
+    # Lay out the rectangles of every trace in one (n_intervals, 2) array;
+    # the rows for trace `i` are `intervals[offsets[i]:offsets[i + 1]]`
+    counts = []
+    for trace in traces:
+        trace._check_exited()
+        counts.append(len(trace._start_times))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    intervals = np.empty((offsets[-1], 2))
+    for trace, lo, hi in zip(traces, offsets[:-1], offsets[1:]):
+        starts = np.array(trace._start_times)
+        intervals[lo:hi, 0] = starts - min_start
+        intervals[lo:hi, 1] = np.array(trace._end_times) - starts
+
     for i, trace in enumerate(traces):
         ax = axes[i]
         ax.set_ylabel(trace.name)
@@ -192,33 +239,31 @@ def _draw_beams(
         ax.set_xticklabels([])
         ax.grid(which="both", axis="x", color="k", linestyle=":")
 
-        series = []
-        for j, (start, stop) in enumerate(trace._zipped()):
-            elapsed = stop - start
-
-            # "For each tuple (xmin, xwidth) a rectangle is drawn from xmin to xmin + xwidth"...
-            start_scaled = start - min_start
-            series.append((start_scaled, elapsed))
-
-            if annotate:
-                annotation = "\n".join(
-                    [
-                        f"iter: {j}",
-                        f"time: {elapsed:,.3f}",
-                    ]
-                )
+        rows = intervals[offsets[i] : offsets[i + 1]]
+        series = rows.tolist()
+
+        if annotate:
+            # build all labels and positions up front; only the `ax.text`
+            # calls are left in the loop. Alternate rows are staggered
+            # vertically so adjacent labels don't overlap
+            annotations = [
+                f"iter: {j}\ntime: {elapsed:,.3f}"
+                for j, (_, elapsed) in enumerate(series)
+            ]
+            text_xs = (rows[:, 0] + padding).tolist()
+            text_ys = (0.55 - 0.25 * (np.arange(len(rows)) % 2)).tolist()
+
+            for x, y, annotation in zip(text_xs, text_ys, annotations):
                 ax.text(
-                    start_scaled + padding,
-                    0.55 - (0.25 * (j % 2)),
+                    x,
+                    y,
                     annotation,
                     horizontalalignment="left",
                     verticalalignment="center",
                     fontsize=annotate_fontsize,
                 )
 
-        ax.broken_barh(
-            series, (0, 1), color=cmap(i / n_traces), linewidth=1, alpha=alpha
-        )
+        ax.broken_barh(series, (0, 1), color=colors[i], linewidth=1, alpha=alpha)
 
     if save_to:
         plt.savefig(save_to, format=save_fmt)
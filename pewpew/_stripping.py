@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compile inline `Beam` blocks out of functions when tracing is disabled
+
+Kept out of `_decorator` so that `ast`/`inspect` are only imported when
+stripping is actually requested.
+"""
+
+import __future__
+import ast
+import inspect
+import textwrap
+import types
+
+__all__ = [
+    "strip_beams",
+]
+
+# compiler flags of `__future__` imports, to recompile with the same semantics
+_FUTURE_FLAGS = 0
+for _feature in __future__.all_feature_names:
+    _FUTURE_FLAGS |= getattr(__future__, _feature).compiler_flag
+del _feature
+
+
+def _is_beam_call(node):
+    """Whether an AST node is a `Beam(...)` or `<anything>.Beam(...)` call"""
+    if not isinstance(node, ast.Call):
+        return False
+    callee = node.func
+    return (isinstance(callee, ast.Name) and callee.id == "Beam") or (
+        isinstance(callee, ast.Attribute) and callee.attr == "Beam"
+    )
+
+
+class _BeamStripper(ast.NodeTransformer):
+    """Remove inline `with Beam(...):` items, splicing in their bodies"""
+
+    def __init__(self):
+        self.stripped = False
+
+    def visit_With(self, node):
+        self.generic_visit(node)
+
+        # `with Beam(...) as b:` binds a name the body may use; keep it
+        kept = [
+            item
+            for item in node.items
+            if item.optional_vars is not None or not _is_beam_call(item.context_expr)
+        ]
+        if len(kept) == len(node.items):
+            return node
+
+        self.stripped = True
+        if kept:
+            node.items = kept
+            return node
+        return node.body
+
+
+def strip_beams(func):
+    """Recompile `func` without its inline `with Beam(...):` blocks
+
+    Used when tracing is disabled, so traced code runs without creating,
+    entering or exiting any inline `Beam`. Only `with` items that construct
+    a `Beam` in place (``with pewpew.Beam("x"):``) are removed. Items bound
+    with ``as`` are kept, since the body may use the name, but every other
+    inline `Beam` in the function is still stripped. Beams bound to names
+    elsewhere are left alone, since they cannot be identified statically.
+
+    This relies on the function's source, so it is conservative: `func`
+    is returned unchanged if the source is unavailable or does not start
+    with its definition, if it is a lambda, a method or nested function
+    (name mangling, closures and `super()` depend on the enclosing scope),
+    or if there is nothing to strip.
+    """
+    # only plain functions; anything else (e.g., a numba dispatcher, which
+    # also exposes `__code__`) is not ours to recompile
+    if not isinstance(func, types.FunctionType):
+        return func
+
+    code = func.__code__
+    if code.co_freevars or func.__qualname__ != func.__name__:
+        return func
+
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return func
+
+    fn_def = tree.body[0] if tree.body else None
+    if not isinstance(fn_def, ast.FunctionDef) or fn_def.name != func.__name__:
+        return func
+
+    stripper = _BeamStripper()
+    stripper.visit(fn_def)
+    if not stripper.stripped:
+        return func
+
+    # don't re-apply decorators (including `@pewpew.trace` itself), and keep
+    # line numbers pointing at the original file
+    fn_def.decorator_list = []
+
+    # Executing the new `def` would evaluate its defaults and annotations a
+    # second time, with whatever side effects they have. Compile it without
+    # them; the values already bound to `func` are copied over below
+    args = fn_def.args
+    args.defaults = []
+    args.kw_defaults = [None] * len(args.kwonlyargs)
+    for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs):
+        arg.annotation = None
+    for arg in (args.vararg, args.kwarg):
+        if arg is not None:
+            arg.annotation = None
+    fn_def.returns = None
+    tree.body = [fn_def]
+    ast.fix_missing_locations(tree)
+    ast.increment_lineno(tree, code.co_firstlineno - 1)
+
+    namespace = {}
+    try:
+        compiled = compile(
+            tree,
+            code.co_filename,
+            "exec",
+            flags=code.co_flags & _FUTURE_FLAGS,
+            dont_inherit=True,
+        )
+        exec(compiled, func.__globals__, namespace)
+    except Exception:
+        return func
+
+    stripped = namespace[func.__name__]
+    stripped.__defaults__ = func.__defaults__
+    stripped.__kwdefaults__ = func.__kwdefaults__
+    stripped.__annotations__ = dict(func.__annotations__)
+    stripped.__dict__.update(func.__dict__)
+    return stripped
@@ -5,8 +5,23 @@ Hoist top level imports
 """
 
 from .beam import Beam  # noqa
-from .tracing import trace  # noqa
+from .tracing import jit_trace, trace  # noqa
 from ._context import clear_trace_history  # noqa
-from ._plotting import draw_trace  # noqa
 
-__all__ = [s for s in dir()]
+__all__ = [
+    "Beam",
+    "clear_trace_history",
+    "draw_trace",
+    "jit_trace",
+    "trace",
+]
+
+
+def __getattr__(name):
+    # plotting is only resolved once somebody actually wants to draw
+    if name == "draw_trace":
+        from ._plotting import draw_trace
+
+        globals()[name] = draw_trace
+        return draw_trace
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
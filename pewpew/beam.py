@@ -4,8 +4,12 @@
 `Beam` class and associated utilities
 """
 
+import array
+import functools
+import itertools
+import operator
+import os
 import time
-import uuid
 
 from pewpew import _context as ctx
 
@@ -13,6 +17,45 @@ __all__ = [
     "Beam",
 ]
 
+# bound once, so timing a block costs a single global lookup per stamp
+_perf_counter = time.perf_counter
+
+# A `Beam`'s unique identifier is (pid, sequence number). Both parts are
+# cheap to read at construction, unlike `uuid.uuid4()`, which hits the OS
+# for random bytes on every call.
+_pid = os.getpid()
+_beam_counter = itertools.count()
+
+
+def _refresh_pid():
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+# Shared stand-in for the timing buffers of a `Beam` that has never been
+# entered. It reads like an empty buffer (len, iteration, indexing) but is
+# never appended to; `__enter__` swaps in real buffers on first use.
+_NO_TIMES = ()
+
+
+@functools.lru_cache(maxsize=None)
+def _clock_overhead(n_iter=1000):
+    """Estimate the cost of a single `Beam` clock read, in seconds
+
+    Measured lazily (and only once) as the smallest delta between two
+    back-to-back clock reads. Spans that are not much longer than this
+    are dominated by timer noise rather than by the code they time.
+    """
+    clock = _perf_counter
+    best = float("inf")
+    for _ in range(n_iter):
+        t0 = clock()
+        best = min(best, clock() - t0)
+    return best
+
 
 class Beam:
     """A context manager for performance timings.
@@ -21,7 +64,7 @@ class Beam:
     The `Span` works by storing the time relative to program start
     (see: `time.perf_counter`) as a starting pointer on `__enter__`,
     and then the new relative time on `__exit__`. Iteration timings are
-    dynamically calculated with the `timings` property.
+    derived from the paired stamps when the `timings` property is read.
 
     NOTE: a span should not be accessed in concurrent fashion. A
     new span should be created for each block that is executed concurrently.
@@ -55,62 +98,113 @@ class Beam:
         does not need to be named with a trailing `i` value, for instance.
     """
 
+    __slots__ = (
+        "name",
+        "_key",
+        "_start",
+        "_stop",
+        "_start_times",
+        "_end_times",
+        "_pending",
+    )
+
     def __init__(self, name):
         self.name = name
         self.clear()
-        self._id = str(uuid.uuid4())
+        self._key = (_pid, next(_beam_counter))
 
         # if this was created inside the context of `@pewpew.trace` we want
-        # to track the Beam within the scope of that context
-        ctx.ContextStore.track_beam(self)
+        # to track the Beam within the scope of that context. Checking the
+        # store's `_active` hint here skips even the method call when no
+        # trace is active, which is the common case
+        store = ctx.ContextStore
+        if store._active:
+            store.track_beam(self)
 
     def clear(self):
         """Completely clear the history of the span, resetting to its zero state"""
         self._reset_counter()
-        self._start_times = []
-        self._end_times = []
+
+        # Buffers are only allocated on the first `__enter__`. Once
+        # allocated, they are `array("d")`, i.e., unboxed C doubles rather
+        # than lists of Python floats
+        self._start_times = self._end_times = _NO_TIMES
+
+        # number of entries that have not exited yet
+        self._pending = 0
 
     def _reset_counter(self):
         """A span can be re-used, and resets on `__enter__`"""
         self._start = self._stop = None
 
+    # NOTE: `__enter__` and `__exit__` are on the hot path of every timed
+    # block, so they inline `_reset_counter` rather than paying for an
+    # extra method call each time.
+
     def __enter__(self):
         """Enter the context manager"""
-        self._reset_counter()
-        self._start = time.perf_counter()
-        self._start_times.append(self._start)
+        # allocate and do the bookkeeping before stamping, so none of it is
+        # timed as part of the block
+        starts = self._start_times
+        if starts is _NO_TIMES:
+            starts = self._start_times = array.array("d")
+            self._end_times = array.array("d")
+
+        self._pending += 1
+        self._stop = None
+        self._start = start = _perf_counter()
+        starts.append(start)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the context manager"""
-        stop = time.perf_counter()
-        self._end_times.append(stop)
-        self._reset_counter()
+        self._end_times.append(_perf_counter())
+        self._pending -= 1
+        self._start = self._stop = None
+
+    # `time.perf_counter` is monotonic and stamps are only ever appended,
+    # so both buffers are sorted and their extremes are at the ends.
 
     def _first_start_time(self):
         """Get the min value of the start array"""
-        return min(self._start_times)
+        return self._start_times[0]
 
     def _last_end_time(self):
         """Get the max value of the end array"""
-        return max(self._end_times)
+        return self._end_times[-1]
 
-    def _zipped(self):
-        """Zip start/end times + concurrency check"""
-        starts = self._start_times
-        stops = self._end_times
-
-        # detect whether someone tries to access this from within
-        # the context manager block
-        if len(starts) != len(stops):
+    def _check_exited(self):
+        """Raise if the beam is accessed from within its own `with` block"""
+        if self._pending:
             raise RuntimeError(
                 f"Concurrent access to {self.__class__.__name__} from within "
                 "context manager block"
             )
-        return zip(starts, stops)
+
+    @property
+    def _id(self):
+        """The unique identifier of the beam, built on demand"""
+        return "%d-%d" % self._key
 
     @property
     def timings(self):
         """Get a span's timing history"""
-        starts_stops = self._zipped()
-        return tuple(map(lambda ab: ab[1] - ab[0], starts_stops))
+        self._check_exited()
+        # every entry has exited, so the i-th stop pairs with the i-th start
+        return tuple(map(operator.sub, self._end_times, self._start_times))
+
+    @property
+    def timings_array(self):
+        """Get a span's timing history as a float64 `numpy.ndarray`
+
+        Subtracts the stamp buffers in C, without building a Python float
+        per entry, which makes it cheaper than `np.asarray(beam.timings)`
+        for numeric consumers. Requires numpy.
+        """
+        import numpy as np
+
+        self._check_exited()
+        # copies rather than views: a view would pin the buffers and stop
+        # them from growing on the next `__enter__`/`__exit__`
+        ends = np.array(self._end_times, dtype=np.float64)
+        return ends - np.array(self._start_times, dtype=np.float64)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import pewpew
+from pewpew import beam
 import pytest
 import time
 
@@ -18,3 +19,56 @@ def test_span_concurrent_access_err():
     span = pewpew.Beam("big_loop")
     with span, pytest.raises(RuntimeError):
         _ = span.timings
+
+
+def test_clock_overhead_is_cached():
+    overhead = beam._clock_overhead()
+    assert overhead >= 0
+    assert beam._clock_overhead() == overhead
+
+
+def test_beam_ids_are_unique():
+    beams = [pewpew.Beam("b") for _ in range(100)]
+    assert len({b._id for b in beams}) == len(beams)
+
+
+def test_timings_match_stamps():
+    span = pewpew.Beam("loop")
+    for _ in range(3):
+        with span:
+            pass
+
+    expected = tuple(b - a for a, b in zip(span._start_times, span._end_times))
+    assert span.timings == expected
+
+
+def test_unentered_beam():
+    span = pewpew.Beam("unused")
+    assert span.timings == ()
+
+    with span:
+        pass
+    assert len(span.timings) == 1
+
+    span.clear()
+    assert span.timings == ()
+
+
+def test_timings_array():
+    np = pytest.importorskip("numpy")
+
+    span = pewpew.Beam("loop")
+    assert span.timings_array.shape == (0,)
+
+    for _ in range(3):
+        with span:
+            pass
+
+    arr = span.timings_array
+    assert arr.dtype == np.float64
+    assert arr.tolist() == list(span.timings)
+
+    # the returned array does not pin the buffer
+    with span:
+        pass
+    assert len(span.timings) == 4
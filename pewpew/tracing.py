@@ -4,13 +4,22 @@
 The `trace` decorator
 """
 
+import os
+import types
+
 from pewpew import _decorator as dec_utils
 from pewpew.utils import validation as val_utils
 
 __all__ = [
+    "jit_trace",
     "trace",
 ]
 
+# Read at decoration time, so `PEWPEW_ENABLED=0` leaves decorated functions
+# completely unwrapped
+_enabled = lambda: os.environ.get("PEWPEW_ENABLED", "1") != "0"
+_strip = lambda: os.environ.get("PEWPEW_STRIP_BEAMS", "0") == "1"
+
 
 def trace(func=None, context_name="function"):
     """Decorates an outer function, auto-tracing all contained `Beams`
@@ -105,20 +114,33 @@ def trace(func=None, context_name="function"):
       decorator instance will absorb any collected traces from the
       context object. This holds true for all nested `@trace`-decorated
       functions, internal or not.
+
+    * If the `PEWPEW_ENABLED` environment variable is set to `"0"` when a
+      function is decorated, `trace` returns the function itself, unwrapped,
+      so leaving `@pewpew.trace` in production code costs nothing per call.
+      If `PEWPEW_STRIP_BEAMS` is also set to `"1"`, inline
+      ``with pewpew.Beam(...):`` blocks in the function body are compiled
+      out as well (see `pewpew._stripping.strip_beams` for the limits).
     """
     if func is not None:
         val_utils.assert_callable(func)
 
     def decorated(inner_func):
+        if not _enabled():
+            if _strip():
+                from pewpew._stripping import strip_beams
+
+                return strip_beams(inner_func)
+            return inner_func
+
         try:
             name = inner_func.__name__
         except AttributeError:
             # TODO: can we auto-discover the module?
             name = context_name
 
-        # Internally, the `Decorator` instance returned will encapsulate
-        # the callstack in a `TraceContext` object that tracks beams that
-        # are created.
+        # Internally, the wrapper returned will encapsulate the callstack
+        # in a `TraceContext` object that tracks beams that are created.
         return dec_utils.make_decorator(inner_func, name=name)
 
     # Code path for `pewpew.pewpew(func=bar, ...)` use case
@@ -131,3 +153,72 @@ def trace(func=None, context_name="function"):
     # def bar(...):
     #     ...
     return decorated
+
+
+def jit_trace(signature=None, context_name="function", **njit_kwargs):
+    """Compile a function with `numba.njit`, then `trace` it
+
+    An opt-in decorator for numeric kernels. The decorated function is
+    compiled to machine code by numba, and the compiled function is
+    wrapped with `trace`. Requires numba (``pip install "pewpew[jit]"``).
+
+    Parameters
+    ----------
+    signature : str, numba signature or list, optional
+        The numba signature(s) to compile for. If given, the function is
+        compiled eagerly, at decoration time, so the first call does not
+        pay for JIT compilation. If None, compilation is lazy and happens
+        on the first call for each new combination of argument types. As
+        with `trace`, the decorator may also be applied bare
+        (``@pewpew.jit_trace``), which compiles lazily.
+
+    context_name : str, optional
+        The name of the trace context. See `trace`.
+
+    **njit_kwargs : keyword args, optional
+        Passed through to `numba.njit`. ``cache=True`` is the default, so
+        compiled code is cached to disk and reused across processes.
+
+    Examples
+    --------
+    >>> import pewpew
+    >>>
+    >>> @pewpew.jit_trace("float64(float64[:])")
+    ... def total(arr):
+    ...     acc = 0.0
+    ...     for v in arr:
+    ...         acc += v
+    ...     return acc
+
+    Notes
+    -----
+    * `Beam` objects cannot be used inside the compiled function, since
+      numba cannot compile them. Time the call from the (uncompiled) caller
+      instead; the call itself is still traced.
+    """
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            '`jit_trace` requires numba: pip install "pewpew[jit]"'
+        ) from e
+
+    njit_kwargs.setdefault("cache", True)
+
+    # Code path for bare `@pewpew.jit_trace`, which passes the function
+    # itself as `signature`
+    func = None
+    if isinstance(signature, types.FunctionType):
+        func, signature = signature, None
+
+    def decorated(func):
+        val_utils.assert_callable(func)
+        if signature is not None:
+            jitted = numba.njit(signature, **njit_kwargs)(func)
+        else:
+            jitted = numba.njit(**njit_kwargs)(func)
+        return trace(jitted, context_name=context_name)
+
+    if func is not None:
+        return decorated(func)
+    return decorated
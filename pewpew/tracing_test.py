@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import itertools
+import logging
 import os
+import time
+
 import pytest
-import tempfile
+
+# Non-interactive backend for the figure tests: skips GUI backend
+# resolution, and must be selected before anything imports pyplot
+import matplotlib
+
+matplotlib.use("Agg")
 
 import pewpew
 from pewpew import _context as ctx
@@ -21,6 +30,54 @@ def arg_decorator_add(a, b):
         return a + b
 
 
+def beam_add(a, b=2):
+    with pewpew.Beam("add1"):
+        return a + b
+
+
+def beam_as_add(a, b):
+    with pewpew.Beam("bound") as bound:
+        with pewpew.Beam("add1"):
+            total = a + b
+    return total, bound.name
+
+
+_default_calls = []
+
+
+def _side_effect_default():
+    _default_calls.append(None)
+    return 2
+
+
+def beam_default_add(a: int, b: int = _side_effect_default(), *, c=0) -> int:
+    with pewpew.Beam("add1"):
+        return a + b + c
+
+
+@pewpew.trace
+def sleepy():
+    with pewpew.Beam("sleepy"):
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def history_size_one():
+    """Limit the trace history to a single trace for the test's scope"""
+    with patching.environ("PEWPEW_TRACE_HISTORY_SIZE", 1):
+        ctx.clear_trace_history()
+        yield
+
+    assert "PEWPEW_TRACE_HISTORY_SIZE" not in os.environ
+    ctx.clear_trace_history()
+
+
+@pytest.fixture(scope="module")
+def fig_dir(tmp_path_factory):
+    """A single output directory shared by all figure tests in the module"""
+    return tmp_path_factory.mktemp("figs")
+
+
 @pytest.mark.parametrize("fn", [no_arg_decorator_add, arg_decorator_add])
 def test_diff_decorator_types(fn):
     ctx.clear_trace_history()
@@ -31,27 +88,175 @@ def test_diff_decorator_types(fn):
 
 
 @pytest.mark.parametrize("fn", [no_arg_decorator_add, arg_decorator_add])
-def test_limit_trace_history_len(fn):
-    with patching.environ("PEWPEW_TRACE_HISTORY_SIZE", 1):
-        ctx.clear_trace_history()
-        assert ctx.ContextStore._maxlen == 1
+def test_limit_trace_history_len(fn, history_size_one):
+    assert ctx.ContextStore._maxlen == 1
 
-        _ = fn(1, 2)
-        assert len(ctx.ContextStore._trace_history) == 1
+    _ = fn(1, 2)
+    assert len(ctx.ContextStore._trace_history) == 1
 
-        # a new call will displace the earlier history here
-        _ = fn(1, 2)
-        assert len(ctx.ContextStore._trace_history) == 1
+    # a new call will displace the earlier history here
+    _ = fn(1, 2)
+    assert len(ctx.ContextStore._trace_history) == 1
+
+
+def test_trace_preserves_metadata():
+    import inspect
+
+    def add(a, b):
+        """Add two numbers"""
+        return a + b
+
+    add.custom = 1
+    traced = pewpew.trace(add)
+    assert traced.__name__ == "add"
+    assert traced.custom == 1
+    assert traced.__doc__ == "Add two numbers"
+    assert traced.__wrapped__ is add
+    assert str(inspect.signature(traced)) == "(a, b)"
+
+
+def test_trace_method():
+    class Adder:
+        def __init__(self, offset):
+            self.offset = offset
+
+        @pewpew.trace
+        def add(self, a):
+            with pewpew.Beam("add"):
+                return self.offset + a
 
-    assert "PEWPEW_TRACE_HISTORY_SIZE" not in os.environ
+    ctx.clear_trace_history()
+    assert Adder(1).add(2) == 3
+    assert Adder.add.name == "add"
+    assert len(ctx.ContextStore.get_trace(name="add")) == 1
+
+
+def test_disabled_trace_returns_function():
+    def add(a, b):
+        with pewpew.Beam("add1"):
+            return a + b
+
+    with patching.environ("PEWPEW_ENABLED", "0"):
+        assert pewpew.trace(add) is add
+        assert pewpew.trace(context_name="disabled")(add) is add
+
+    ctx.clear_trace_history()
+    assert add(1, 2) == 3
+    assert not ctx.ContextStore._trace_history
+
+
+def test_jit_trace():
+    pytest.importorskip("numba")
+
+    @pewpew.jit_trace("int64(int64, int64)", cache=False)
+    def jit_add(a, b):
+        return a + b
+
+    # metadata comes from the Python function, not the numba dispatcher
+    assert jit_add.__name__ == "jit_add"
+    assert set(vars(jit_add)) == {"__wrapped__", "name"}
+    assert not hasattr(jit_add.__wrapped__, "py_func")
+
+    ctx.clear_trace_history()
+    assert jit_add(1, 2) == 3
+    assert len(ctx.ContextStore._trace_history) == 1
+
+
+def test_jit_trace_bare():
+    pytest.importorskip("numba")
+
+    @pewpew.jit_trace
+    def jit_add(a, b):
+        return a + b
+
+    ctx.clear_trace_history()
+    assert jit_add.name == "jit_add"
+    assert jit_add(1, 2) == 3
+    assert len(ctx.ContextStore._trace_history) == 1
+
+
+def test_disabled_trace_strips_beams():
+    with patching.environ("PEWPEW_ENABLED", "0"):
+        assert pewpew.trace(beam_add) is beam_add
+
+        with patching.environ("PEWPEW_STRIP_BEAMS", "1"):
+            stripped = pewpew.trace(beam_add)
+
+    assert stripped is not beam_add
+    assert stripped.__name__ == "beam_add"
+
+    with ctx.TraceContext(name="outer") as outer:
+        assert stripped(1) == stripped(1, 2) == 3
+        assert not outer._beams
+
+        # the original still creates its beam
+        assert beam_add(1) == 3
+        assert len(outer._beams) == 1
+
+
+def test_disabled_trace_keeps_bound_beams():
+    with patching.environ("PEWPEW_ENABLED", "0"):
+        with patching.environ("PEWPEW_STRIP_BEAMS", "1"):
+            stripped = pewpew.trace(beam_as_add)
+
+    # only the inline beam is compiled out; the `as`-bound one stays
+    assert stripped is not beam_as_add
+    with ctx.TraceContext(name="outer") as outer:
+        assert stripped(1, 2) == (3, "bound")
+        assert [beam.name for beam in outer._beams] == ["bound"]
+
+
+def test_disabled_trace_strip_keeps_defaults():
+    n_calls = len(_default_calls)
+    with patching.environ("PEWPEW_ENABLED", "0"):
+        with patching.environ("PEWPEW_STRIP_BEAMS", "1"):
+            stripped = pewpew.trace(beam_default_add)
+
+    # defaults are carried over, not re-evaluated
+    assert stripped is not beam_default_add
+    assert len(_default_calls) == n_calls
+    assert stripped(1) == 3
+    assert stripped(1, c=1) == 4
+    assert stripped.__annotations__ == beam_default_add.__annotations__
+
+
+def test_empty_trace_history_size_is_unbounded():
+    with patching.environ("PEWPEW_TRACE_HISTORY_SIZE", ""):
+        ctx.clear_trace_history()
+        assert ctx.ContextStore._maxlen is None
+        assert ctx.ContextStore._trace_history.maxlen is None
     ctx.clear_trace_history()
 
 
 @pytest.mark.parametrize("fn", [no_arg_decorator_add, arg_decorator_add])
-def test_can_save_fig(fn):
+def test_can_save_fig(fn, fig_dir):
     ctx.clear_trace_history()
     _ = fn(1, 2)
 
-    with tempfile.TemporaryDirectory() as tmp:
-        pewpew.draw_trace(save_to=f"{tmp}/fig.png", annotate=True)
-        assert os.path.exists(f"{tmp}/fig.png")
+    save_to = fig_dir / f"{fn.__name__}.png"
+    pewpew.draw_trace(save_to=str(save_to), annotate=True)
+    assert save_to.exists()
+
+
+@pytest.mark.parametrize("clock_step,warns", [(1e-12, True), (None, False)])
+def test_draw_trace_warns_on_unresolvable_spans(
+    clock_step, warns, fig_dir, caplog, monkeypatch
+):
+    from pewpew import beam
+
+    # measure the real clock overhead before (possibly) faking the clock
+    beam._clock_overhead()
+    if clock_step is not None:
+        # every stamp is `clock_step` after the last, far below the overhead
+        ticks = itertools.count()
+        monkeypatch.setattr(beam, "_perf_counter", lambda: next(ticks) * clock_step)
+
+    ctx.clear_trace_history()
+    sleepy()
+
+    save_to = fig_dir / f"clock_step_{clock_step}.png"
+    with caplog.at_level(logging.WARNING, logger="pewpew._plotting"):
+        pewpew.draw_trace(save_to=str(save_to))
+
+    warned = any("clock overhead" in r.getMessage() for r in caplog.records)
+    assert warned is warns
@@ -4,8 +4,6 @@
 Iterable utils
 """
 
-from pewpew.utils import validation as val_utils
-
 __all__ = [
     "assert_sized_iterable",
     "find_first",
@@ -38,31 +36,39 @@ def assert_sized_iterable(
     gt_size : int, optional
         A length to assert an iterable is GREATER THAN
     """
-    arg_name = val_utils.coalesce(arg_name, "arg")
-
-    if not isinstance(x, (list, tuple)):
+    # NOTE: `arg_name` is only defaulted on the way to a raise, so a
+    # successful check never pays for it
+
+    # exact-type identity checks first; `isinstance` (and its MRO walk) only
+    # runs for subclasses such as namedtuples, or on failure
+    t = type(x)
+    if t is not list and t is not tuple and not isinstance(x, (list, tuple)):
+        arg_name = arg_name if arg_name is not None else "arg"
         raise TypeError(
             f"Expected list or tuple for `{arg_name}` but got type={type(x)}"
         )
 
     n_elem = len(x)
     if lt_size is not None and n_elem >= lt_size:
+        arg_name = arg_name if arg_name is not None else "arg"
         raise ValueError(
             f"Expected {arg_name} to have fewer than {lt_size} items, but found {n_elem}"
         )
 
     if eq_size is not None and n_elem != eq_size:
+        arg_name = arg_name if arg_name is not None else "arg"
         raise ValueError(
             f"Expected {arg_name} to have exactly {eq_size} items, but found {n_elem}"
         )
 
     if gt_size is not None and n_elem <= gt_size:
+        arg_name = arg_name if arg_name is not None else "arg"
         raise ValueError(
             f"Expected {arg_name} to have greater than {gt_size} items, but found {n_elem}"
         )
 
 
-def find_first(it, true_fn):
+def find_first(it, true_fn, *, vectorized=False):
     """Find and return first element where `true_fn` is True
 
     Finds the first element in `it` for which `true_fn` is True, returning
@@ -78,11 +84,40 @@ def find_first(it, true_fn):
         A function that accepts an element of `it` and evaluates to a
         truthy value.
 
+    vectorized : bool, optional
+        If True, `it` must be a 1-D numpy array and `true_fn` an
+        element-wise predicate that accepts the whole array and returns a
+        boolean mask of the same shape, e.g., ``lambda e: e % 2 == 0``. The
+        first match is then located with a single `argmax`, rather than one
+        Python call per element. Predicates that reduce over the array
+        (e.g., ``lambda e: e == e.max()``) will not give element-wise
+        answers in this mode. Default is False. Requires numpy.
+
     Notes
     -----
-    * If you pass a generator for `it`, it will be exhausted
+    * If you pass a generator for `it`, it will be consumed up to and
+      including the first match
     """
-    for e in it:
-        if true_fn(e):
-            return e
-    return None
+    if vectorized:
+        import numpy as np
+
+        if not isinstance(it, np.ndarray) or it.ndim != 1:
+            raise TypeError(
+                "Expected a 1-D numpy array for `it` with vectorized=True, "
+                f"but got type={type(it)}"
+            )
+
+        mask = np.asarray(true_fn(it), dtype=bool)
+        if mask.shape != it.shape:
+            raise ValueError(
+                f"Expected `true_fn` to return a mask of shape {it.shape}, "
+                f"but got shape {mask.shape}"
+            )
+
+        if not mask.size:
+            return None
+        idx = mask.argmax()
+        return it[idx] if mask[idx] else None
+
+    # the iteration itself runs in C; only `true_fn` is called per element
+    return next(filter(true_fn, it), None)
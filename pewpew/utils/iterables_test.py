@@ -47,3 +47,34 @@ def test_assert_sized_iterable(
 def test_find_first(it, fn, exp):
     got = iter_utils.find_first(it, fn)
     assert exp == got, got
+
+
+@pytest.mark.parametrize(
+    "fn,exp",
+    [
+        pytest.param(lambda e: e % 2 == 0, 2),
+        pytest.param(lambda e: e > 10, None),
+    ],
+)
+def test_find_first_vectorized(fn, exp):
+    np = pytest.importorskip("numpy")
+    got = iter_utils.find_first(np.arange(1, 7), fn, vectorized=True)
+    assert exp == got, got
+    assert iter_utils.find_first(np.arange(0), fn, vectorized=True) is None
+
+
+def test_find_first_ndarray_is_element_wise_by_default():
+    np = pytest.importorskip("numpy")
+    arr = np.array([3, 1, 7, 2])
+
+    # a reduction in the predicate must see one element at a time
+    got = iter_utils.find_first(arr, lambda e: e == e.max())
+    assert got == 3, got
+
+
+def test_find_first_vectorized_bad_input():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(TypeError):
+        iter_utils.find_first([1, 2], lambda e: e > 1, vectorized=True)
+    with pytest.raises(ValueError):
+        iter_utils.find_first(np.arange(3), lambda e: True, vectorized=True)
@@ -7,16 +7,23 @@ __all__ = [
     "environ",
 ]
 
+_MISSING = object()
+
 
 @contextlib.contextmanager
 def environ(k, v):
-    """Patch an environment variable for the context of this scope"""
-    original = os.environ.get(k, None)
+    """Patch an environment variable for the context of this scope
+
+    On exit, the variable is restored to its previous value, or removed if
+    it was not previously set. Nested patches of the same variable unwind
+    correctly.
+    """
+    original = os.environ.get(k, _MISSING)
+    os.environ[k] = v if isinstance(v, str) else str(v)
     try:
-        os.environ[k] = str(v)
         yield
     finally:
-        if original is not None:
+        if original is _MISSING:
+            os.environ.pop(k, None)
+        else:
             os.environ[k] = original
-        elif k in os.environ:
-            del os.environ[k]
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from pewpew.utils import patching
+
+_KEY = "PEWPEW_PATCHING_TEST_VAR"
+
+
+def test_environ_unset_var():
+    assert _KEY not in os.environ
+    with patching.environ(_KEY, 1):
+        assert os.environ[_KEY] == "1"
+    assert _KEY not in os.environ
+
+
+def test_environ_nested_and_restored():
+    with patching.environ(_KEY, ""):
+        with patching.environ(_KEY, "inner"):
+            assert os.environ[_KEY] == "inner"
+
+        # an empty string is a value, and must be restored as one
+        assert os.environ[_KEY] == ""
+    assert _KEY not in os.environ
@@ -29,7 +29,9 @@ def do_setup():
         license="MIT",
         packages=find_packages(),
         include_package_data=True,
+        package_data={"pewpew": ["*.pyi", "py.typed"]},
         install_requires=REQUIREMENTS,
+        extras_require={"jit": ["numba"]},
         python_requires=">=3.8, <4",
     )
 